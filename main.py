@@ -6,7 +6,7 @@ from models.enums import Category, OrderStatus
 def main():
     restaurant = Restaurant("Adams Restaurant")
 
-    restaurant.load_data()
+    restaurant.load_data(lazy=True)
 
     menu = restaurant.menu
 
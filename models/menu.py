@@ -1,68 +1,160 @@
+import threading
+
 from .menu_item import MenuItem
+from .menu_snapshot import MenuSnapshot
 from .enums import Category
-from .exceptions import MenuItemExistsError ,MenuItemNotFoundError
+from .exceptions import MenuItemExistsError ,MenuItemNotFoundError, MenuValidationError
 
 class Menu:
+  _UPDATE_KEYS = {"name", "category", "price", "available", "description"}
+
   def __init__(self):
-    self._items = {}
-  
-  def _normalize_name(self, name: str) -> str:
-    return name.strip().lower()
+    self._snapshot = MenuSnapshot(version=1, items={})
+    self._write_lock = threading.Lock()
+
+  @property
+  def _items(self):
+    return self._snapshot.items
+
+  @property
+  def version(self) -> int:
+    return self._snapshot.version
+
+  def snapshot(self) -> MenuSnapshot:
+    """
+    Return the current menu version. Readers keep a consistent view
+    for as long as they hold it, without taking any lock.
+    """
+    return self._snapshot
+
+  def _publish(self, items: dict, version: int | None = None) -> int:
+    # Swapping the reference is the only thing readers ever see change.
+    new_version = self._snapshot.version + 1
+    if version is not None:
+      new_version = max(version, new_version)
+    self._snapshot = MenuSnapshot(version=new_version, items=items)
+    return new_version
   
   def _make_key(self, name: str, category: Category):
-    normalized = self._normalize_name(name)
-    return (normalized, category)
+    return MenuSnapshot.make_key(name, category)
   
   def add_item(self, item: MenuItem):
-    key = self._make_key(item.name, item.category)
-    if key in self._items:
-        raise MenuItemExistsError("Item already exists in menu.")
-    self._items[key] = item
+    self.add_items([item])
+
+  def add_items(self, items: list[MenuItem], version: int | None = None) -> int:
+    """
+    Add several items as one new menu version and freeze them.
+    Nothing is added if any of them already exists. A saved version
+    number can be passed when restoring a menu. An empty batch publishes
+    nothing unless it moves the version forward.
+    """
+    with self._write_lock:
+      if not items and (version is None or version <= self._snapshot.version):
+        return self._snapshot.version
+
+      new_items = dict(self._items)
+      for item in items:
+        key = self._make_key(item.name, item.category)
+        if key in new_items:
+          raise MenuItemExistsError("Item already exists in menu.")
+        new_items[key] = item
+
+      for item in items:
+        item.freeze()
+      return self._publish(new_items, version)
 
   def remove_item(self, name: str, category: Category):
     key = self._make_key(name, category)
-    if key not in self._items:
-      raise MenuItemNotFoundError("Item not found in menu.")
-    del self._items[key]
+    with self._write_lock:
+      if key not in self._items:
+        raise MenuItemNotFoundError("Item not found in menu.")
+      new_items = dict(self._items)
+      del new_items[key]
+      self._publish(new_items)
 
   def get_item(self, name: str, category: Category):
-    key = self._make_key(name, category)
-    if key in self._items:
-      return self._items[key]
-    return None
+    return self._snapshot.get_item(name, category)
   
   def list_items(self, category: Category = None):
-    if category is None:
-     return list(self._items.values())
-     
-    filtered_items = []
-
-    for item in self._items.values():
-       if item.category == category:
-         filtered_items.append(item)
-    return  filtered_items
+    return self._snapshot.list_items(category)
+
+  def apply_updates(self, updates: list[dict]) -> int:
+    """
+    Apply many price / availability / description changes as one new
+    menu version. Each update is a dict with "name", "category" and
+    optional "price", "available" and "description" keys. Changed items are copied, so items already in
+    orders keep their price. If any update is invalid nothing is applied,
+    and no version is published when nothing actually changes.
+    Returns the current version number.
+    """
+    with self._write_lock:
+      current = self._items
+      changed = {}
+
+      for update in updates:
+        self._validate_update(update)
+        key = self._make_key(update["name"], update["category"])
+        if key not in current:
+          raise MenuItemNotFoundError("Item not found in menu.")
+
+        item = changed.get(key)
+        if item is None:
+          item = current[key].copy()
+        if "price" in update:
+          item.update_price(update["price"])
+        if "available" in update:
+          item.set_availability(update["available"])
+        if "description" in update:
+          item.update_description(update["description"])
+        changed[key] = item
+
+      changed = {
+        key: item for key, item in changed.items()
+        if (item.price, item.available, item.description)
+        != (current[key].price, current[key].available, current[key].description)
+      }
+      if not changed:
+        return self._snapshot.version
+
+      for item in changed.values():
+        item.freeze()
+      new_items = dict(current)
+      new_items.update(changed)
+      return self._publish(new_items)
+
+  def _validate_update(self, update: dict) -> None:
+    if not isinstance(update, dict):
+      raise MenuValidationError("Each update must be a dict.")
+
+    missing = {"name", "category"} - update.keys()
+    if missing:
+      raise MenuValidationError(f"Update is missing: {', '.join(sorted(missing))}.")
+
+    unknown = update.keys() - self._UPDATE_KEYS
+    if unknown:
+      raise MenuValidationError(f"Unknown update keys: {', '.join(sorted(unknown))}.")
+
+    if not isinstance(update["category"], Category):
+      raise MenuValidationError("category must be a Category value.")
+
+    price = update.get("price", 1)
+    if isinstance(price, bool) or not isinstance(price, (int, float)):
+      raise MenuValidationError("Price must be a number.")
   
   def update_item_price(self, name, category, new_price):
-    key = self._make_key(name, category)
-
-    if key not in self._items:
-      raise MenuItemNotFoundError("Item not found in menu.")
-    item = self._items[key]
-    item.update_price(new_price)
+    self.apply_updates([{"name": name, "category": category, "price": new_price}])
 
   def set_item_availability(self, name, category, status):
-    key = self._make_key(name, category)
+    self.apply_updates([{"name": name, "category": category, "available": status}])
 
-    if key not in self._items:
-      raise MenuItemNotFoundError("Item not found in menu.")
-    item = self._items[key]
-    item.set_availability(status)
+  def update_item_description(self, name, category, new_description):
+    self.apply_updates([{"name": name, "category": category, "description": new_description}])
 
   def search(self, keyword: str):
     normalized = keyword.strip().lower()
     results = []
     
-    for item in self._items.values():
+    for item in self._snapshot.list_items():
       name_match = normalized in item.name.lower()
       description_match = normalized in item.description.lower()
       if name_match or description_match:
@@ -70,13 +162,14 @@ class Menu:
     return results
   
   def __str__(self):
-    if not self._items:
+    snapshot = self._snapshot
+    if not snapshot:
         return "Menu is empty."
     
     lines = []
 
     categories = {}
-    for item in self._items.values():
+    for item in snapshot.list_items():
         categories.setdefault(item.category, []).append(item)
     
     for category in sorted(categories.keys(), key=lambda c: c.value):
@@ -2,6 +2,12 @@ from .enums import Category
 from .exceptions import MenuValidationError
 
 class MenuItem:
+    """
+    A dish or drink on the menu.
+    Once an item is published in a menu snapshot it is frozen and can no
+    longer be changed; use Menu.apply_updates instead.
+    """
+
     def __init__(self, name: str , price: float , category: Category , description: str = "", available: bool = True):
         self.name = name
         self.price = price
@@ -9,6 +15,16 @@ class MenuItem:
         self.description = description
         self.available = available
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise MenuValidationError(
+                "Menu item is part of a published menu; use Menu.apply_updates to change it."
+            )
+        super().__setattr__(name, value)
+
+    def freeze(self) -> None:
+        object.__setattr__(self, "_frozen", True)
+
     def update_price(self, new_price: float):
         if new_price <= 0:
             raise MenuValidationError("Price must be strictly greater than 0.")
@@ -27,6 +43,28 @@ class MenuItem:
             raise MenuValidationError("Description must be a string or None.")
         self.description = new_description.strip()
 
+    def copy(self) -> "MenuItem":
+        """
+        Return an unfrozen copy of this item.
+        """
+        return MenuItem(
+            name=self.name,
+            price=self.price,
+            category=self.category,
+            description=self.description,
+            available=self.available,
+        )
+
+    @classmethod
+    def from_dict(cls, item_data: dict) -> "MenuItem":
+        return cls(
+            name=item_data["name"],
+            price=item_data["price"],
+            category=Category(item_data["category"]),
+            description=item_data["description"],
+            available=item_data["available"],
+        )
+
     def to_dict(self):
         item_data = {
             "name": self.name,
@@ -0,0 +1,34 @@
+from types import MappingProxyType
+
+from .menu_item import MenuItem
+from .enums import Category
+
+
+class MenuSnapshot:
+  """
+  Read-only view of the menu at one version.
+  The MenuItem objects in it are frozen; changes go through the Menu,
+  which publishes a new snapshot instead.
+  """
+
+  def __init__(self, version: int, items: dict[tuple[str, Category], MenuItem]):
+    self.version = version
+    self.items = MappingProxyType(items)
+
+  @staticmethod
+  def make_key(name: str, category: Category) -> tuple[str, Category]:
+    return (name.strip().lower(), category)
+
+  def get_item(self, name: str, category: Category) -> MenuItem | None:
+    return self.items.get(self.make_key(name, category))
+
+  def list_items(self, category: Category = None) -> list[MenuItem]:
+    if category is None:
+      return list(self.items.values())
+    return [item for item in self.items.values() if item.category == category]
+
+  def __len__(self) -> int:
+    return len(self.items)
+
+  def __repr__(self) -> str:
+    return f"MenuSnapshot(version={self.version!r}, items={len(self.items)!r})"
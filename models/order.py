@@ -1,11 +1,17 @@
 from .order_item import OrderItem
 from .menu_item import MenuItem
+from .menu_snapshot import MenuSnapshot
 from .enums import Category, OrderStatus
 from .exceptions import MenuValidationError, MenuItemNotFoundError
 
 
 class Order:
-    def __init__(self, order_id: int, status: OrderStatus = OrderStatus.Pending):
+    def __init__(
+        self,
+        order_id: int,
+        status: OrderStatus = OrderStatus.Pending,
+        menu_version: int | None = None,
+    ):
         if not isinstance(order_id, int):
             raise MenuValidationError("order_id must be an integer.")
 
@@ -15,17 +21,21 @@ class Order:
         if not isinstance(status, OrderStatus):
             raise MenuValidationError("status must be an OrderStatus value.")
 
+        if menu_version is not None and (not isinstance(menu_version, int) or menu_version < 1):
+            raise MenuValidationError("menu_version must be a positive integer.")
+
         self.order_id = order_id
         self.status = status
+        # Version of the menu when this order was created; it is not updated
+        # later. Items added afterwards come from the menu current at that
+        # time. Each OrderItem keeps the menu item it was first added with,
+        # so the price of an item already in the order never changes.
+        self.menu_version = menu_version
         self._items: dict[tuple[str, Category], OrderItem] = {}
 
 
-    def _normalize_name(self, name: str) -> str:
-        return name.strip().lower()
-
     def _make_key(self, name: str, category: Category) -> tuple[str, Category]:
-        normalized = self._normalize_name(name)
-        return (normalized, category)
+        return MenuSnapshot.make_key(name, category)
 
     def _make_key_from_item(self, item: MenuItem) -> tuple[str, Category]:
         return self._make_key(item.name, item.category)
@@ -83,6 +93,12 @@ class Order:
         del self._items[key]
 
 
+    def get_item(self, name: str, category: Category) -> OrderItem | None:
+        """
+        Return the OrderItem for a name and category, or None if it isn't in the order.
+        """
+        return self._items.get(self._make_key(name, category))
+
     def get_items(self) -> list[OrderItem]:
         """
         Return a list of OrderItem objects in this order.
@@ -105,6 +121,7 @@ class Order:
         return {
             "order_id": self.order_id,
             "status": self.status.value,
+            "menu_version": self.menu_version,
             "items": [oi.to_dict() for oi in self.get_items()],
             "total": self.total(),
         }
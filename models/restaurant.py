@@ -1,4 +1,5 @@
 from .menu import Menu
+from .menu_snapshot import MenuSnapshot
 from .order import Order
 from .menu_item import MenuItem
 from .enums import Category, OrderStatus
@@ -16,13 +17,30 @@ class Restaurant:
         self._orders: dict[int, Order] = {}
         self._next_order_id: int = 1
 
+        # Fast-startup state: raw order records that have not been turned into
+        # Order objects yet, and the revenue those records contribute.
+        # _raw_orders is None while the orders file has not been read.
+        self._orders_file: str | None = None
+        self._raw_orders: dict[int, dict] | None = {}
+        self._unhydrated_order_count: int = 0
+        self._unhydrated_status_counts: dict[str, int] = {}
+        self._unhydrated_revenue: float = 0.0
+
 
     def create_order(self) -> Order:
         """
         Create a new order with an auto-incremented ID and status Pending.
         Returns the created Order instance.
         """
-        order = Order(order_id=self._next_order_id, status=OrderStatus.Pending)
+        # The header may be stale, so check the IDs in the orders file first.
+        if self._raw_orders is None:
+            self._load_raw_orders()
+
+        order = Order(
+            order_id=self._next_order_id,
+            status=OrderStatus.Pending,
+            menu_version=self.menu.version,
+        )
         self._orders[order.order_id] = order
         self._next_order_id += 1
         return order
@@ -31,7 +49,10 @@ class Restaurant:
         """
         Return an Order by ID, or None if it doesn't exist.
         """
-        return self._orders.get(order_id)
+        order = self._orders.get(order_id)
+        if order is None and self._has_raw_orders():
+            order = self._hydrate_order(order_id)
+        return order
 
     def require_order(self, order_id: int) -> Order:
         """
@@ -46,7 +67,10 @@ class Restaurant:
         """
         Return a list of all orders in the restaurant.
         """
-        return list(self._orders.values())
+        if self._has_raw_orders():
+            for order_id in list(self._load_raw_orders()):
+                self._hydrate_order(order_id)
+        return sorted(self._orders.values(), key=lambda order: order.order_id)
 
     def list_orders_by_status(self, status: OrderStatus) -> list[Order]:
         """
@@ -54,17 +78,60 @@ class Restaurant:
         """
         if not isinstance(status, OrderStatus):
             raise MenuValidationError("status must be an OrderStatus value.")
-        return [order for order in self._orders.values() if order.status == status]
+
+        if self._has_raw_orders():
+            raw_orders = self._load_raw_orders()
+            matching_ids = [
+                order_id for order_id, record in raw_orders.items()
+                if record["status"] == status.value
+            ]
+            for order_id in matching_ids:
+                self._hydrate_order(order_id)
+
+        return [
+            order
+            for order in sorted(self._orders.values(), key=lambda order: order.order_id)
+            if order.status == status
+        ]
+
+    def order_count(self) -> int:
+        """
+        Number of orders, including raw records that have not been hydrated yet.
+        """
+        return len(self._orders) + self._unhydrated_order_count
+
+    def count_orders_by_status(self, status: OrderStatus) -> int:
+        """
+        Number of orders with the given status, without hydrating raw records.
+        """
+        if not isinstance(status, OrderStatus):
+            raise MenuValidationError("status must be an OrderStatus value.")
+
+        loaded = sum(1 for order in self._orders.values() if order.status == status)
+        return loaded + self._unhydrated_status_counts.get(status.value, 0)
 
     def _get_menu_item_or_raise(self, name: str, category: Category) -> MenuItem:
         """
-        Helper: fetch item from menu or raise MenuItemNotFoundError.
+        Helper: fetch an available item from the current menu or raise
+        MenuItemNotFoundError / MenuValidationError.
         """
         item = self.menu.get_item(name, category)
         if item is None:
             raise MenuItemNotFoundError("Item not found in menu.")
+        if not item.available:
+            raise MenuValidationError("Item is not available.")
         return item
 
+    def _get_order_item_or_raise(self, order: Order, name: str, category: Category) -> MenuItem:
+        """
+        Helper: fetch the menu item an order already contains, even if the
+        menu has changed since, or raise MenuItemNotFoundError.
+        """
+        order_item = order.get_item(name, category)
+        if order_item is None:
+            raise MenuItemNotFoundError("Item not found in this order.")
+        return order_item.item
+
     def add_item_to_order(
         self,
         order_id: int,
@@ -74,7 +141,9 @@ class Restaurant:
     ) -> None:
         """
         Add a menu item to an existing order by order_id.
-        If the item already exists in the order, increases its quantity.
+        The item must be available in the current menu. If it is already in
+        the order, its quantity increases and it keeps the price it was first
+        added with.
         """
         order = self.require_order(order_id)
         menu_item = self._get_menu_item_or_raise(item_name, category)
@@ -91,7 +160,7 @@ class Restaurant:
         Change the quantity of an item inside a given order.
         """
         order = self.require_order(order_id)
-        menu_item = self._get_menu_item_or_raise(item_name, category)
+        menu_item = self._get_order_item_or_raise(order, item_name, category)
         order.change_item_quantity(menu_item, new_quantity)
 
     def remove_item_from_order(
@@ -104,7 +173,7 @@ class Restaurant:
         Remove an item completely from an order.
         """
         order = self.require_order(order_id)
-        menu_item = self._get_menu_item_or_raise(item_name, category)
+        menu_item = self._get_order_item_or_raise(order, item_name, category)
         order.remove_item(menu_item)
 
 
@@ -119,13 +188,102 @@ class Restaurant:
     def total_revenue(self) -> float:
         """
         Sum of totals for all completed orders.
+        Raw records that are not hydrated yet are counted from the orders header.
         """
-        return sum(
+        return self._unhydrated_revenue + sum(
             order.total()
             for order in self._orders.values()
             if order.status == OrderStatus.Completed
         )
 
+    def _order_header(self) -> dict:
+        """
+        Small summary of the orders file, so aggregates don't need every order.
+        """
+        status_counts = {status.value: 0 for status in OrderStatus}
+        for order in self._orders.values():
+            status_counts[order.status.value] += 1
+
+        return {
+            "order_count": len(self._orders),
+            "next_order_id": self._next_order_id,
+            "total_revenue": self.total_revenue(),
+            "status_counts": status_counts,
+        }
+
+    def _has_raw_orders(self) -> bool:
+        """
+        True while some orders may still exist only as raw records.
+        """
+        return self._raw_orders is None or bool(self._raw_orders)
+
+    def _load_raw_orders(self) -> dict[int, dict]:
+        """
+        Read the orders file into raw records keyed by order_id (only once).
+        The figures taken from the header are replaced with ones computed
+        from the records, in case the header is stale.
+        """
+        if self._raw_orders is None:
+            orders_data = load_json(self._orders_file) or []
+            raw_orders = {}
+            for od in orders_data:
+                if od["order_id"] in self._orders:
+                    raise MenuValidationError(
+                        f"Order with ID {od['order_id']} in {self._orders_file} "
+                        "clashes with an order already in memory."
+                    )
+                raw_orders[od["order_id"]] = od
+            self._raw_orders = raw_orders
+
+            self._unhydrated_order_count = len(self._raw_orders)
+            self._unhydrated_status_counts = {status.value: 0 for status in OrderStatus}
+            self._unhydrated_revenue = 0.0
+            for record in self._raw_orders.values():
+                self._unhydrated_status_counts[record["status"]] += 1
+                if record["status"] == OrderStatus.Completed.value:
+                    self._unhydrated_revenue += record["total"]
+
+            if self._raw_orders:
+                self._next_order_id = max(self._next_order_id, max(self._raw_orders) + 1)
+        return self._raw_orders
+
+    def _hydrate_order(self, order_id: int) -> Order | None:
+        """
+        Build the Order for a raw record and move it into the loaded orders.
+        """
+        raw_orders = self._load_raw_orders()
+        od = raw_orders.pop(order_id, None)
+        if od is None:
+            return None
+
+        order = self._build_order(od)
+        self._orders[order.order_id] = order
+        self._unhydrated_order_count -= 1
+        self._unhydrated_status_counts[od["status"]] -= 1
+
+        if od["status"] == OrderStatus.Completed.value:
+            self._unhydrated_revenue -= od["total"]
+        if not self._unhydrated_order_count:
+            self._unhydrated_revenue = 0.0
+
+        return order
+
+    def _build_order(self, od: dict) -> Order:
+        """
+        Create an Order from its JSON record.
+        Items are rebuilt from the data stored in the record, so the order keeps
+        the prices it was saved with and the menu is not touched.
+        """
+        order = Order(
+            order_id=od["order_id"],
+            status=OrderStatus(od["status"]),
+            menu_version=od.get("menu_version"),
+        )
+        for item_dict in od["items"]:
+            order.add_item(MenuItem.from_dict(item_dict["item"]), item_dict["quantity"])
+
+        return order
+
     def to_dict(self) -> dict:
         """
         Serialize the restaurant, including menu and all orders.
@@ -138,66 +296,87 @@ class Restaurant:
         }
 
 
-    def save_data(self, menu_file: str = "data/menu.json", orders_file: str = "data/orders.json") -> None:
+    def save_data(
+        self,
+        menu_file: str = "data/menu.json",
+        orders_file: str = "data/orders.json",
+        header_file: str = "data/orders_header.json",
+    ) -> None:
         """
-        Save menu and orders to JSON files.
+        Save menu, orders and the orders header to JSON files.
         """
 
-        menu_data = [item.to_dict() for item in self.menu.list_items()]
+        snapshot = self.menu.snapshot()
+        menu_data = {
+            "version": snapshot.version,
+            "items": [item.to_dict() for item in snapshot.list_items()],
+        }
         save_json(menu_data, menu_file)
 
         orders_data = [order.to_dict() for order in self.list_orders()]
         save_json(orders_data, orders_file)
 
-    def load_data(self, menu_file: str = "data/menu.json", orders_file: str = "data/orders.json") -> None:
+        save_json(self._order_header(), header_file)
+
+    def load_data(
+        self,
+        menu_file: str = "data/menu.json",
+        orders_file: str = "data/orders.json",
+        header_file: str = "data/orders_header.json",
+        lazy: bool = False,
+    ) -> None:
         """
         Load menu and orders from JSON files, if they exist.
-        """
-        from .order_item import OrderItem 
 
+        With lazy=True only the menu and the orders header are read. The orders
+        file is read the first time an order is requested or created, and each
+        record is turned into an Order only when get_order / list_orders reaches it.
+        Falls back to a full load when there is no header file.
+
+        Orders are rebuilt from the item data stored with them, so both modes
+        report the same totals and neither adds order items to the menu.
+        """
         menu_data = load_json(menu_file)
         if menu_data:
+            # Older files hold a plain list of items without a version.
+            menu_version = None
+            if isinstance(menu_data, dict):
+                menu_version = menu_data["version"]
+                menu_data = menu_data["items"]
+
+            new_items = []
+            seen_keys = set()
             for item_data in menu_data:
-                item = MenuItem(
-                    name=item_data["name"],
-                    price=item_data["price"],
-                    category=Category(item_data["category"]),
-                    description=item_data["description"],
-                    available=item_data["available"],
-                )
+                item = MenuItem.from_dict(item_data)
+
+                key = MenuSnapshot.make_key(item.name, item.category)
+                if key not in seen_keys and self.menu.get_item(item.name, item.category) is None:
+                    seen_keys.add(key)
+                    new_items.append(item)
+
+            if new_items or (menu_version is not None and menu_version > self.menu.version):
+                self.menu.add_items(new_items, version=menu_version)
+
+        self._orders_file = orders_file
 
-                if self.menu.get_item(item.name, item.category) is None:
-                    self.menu.add_item(item)
+        header = load_json(header_file) if lazy else None
+        if header is not None:
+            self._raw_orders = None
+            self._unhydrated_order_count = header["order_count"]
+            self._unhydrated_status_counts = dict(header["status_counts"])
+            self._unhydrated_revenue = header["total_revenue"]
+            self._next_order_id = max(self._next_order_id, header["next_order_id"])
+            return
 
         orders_data = load_json(orders_file)
         max_order_id = 0
 
         if orders_data:
             for od in orders_data:
-                order = Order(
-                    order_id=od["order_id"],
-                    status=OrderStatus(od["status"])
-                )
+                order = self._build_order(od)
                 self._orders[order.order_id] = order
                 max_order_id = max(max_order_id, order.order_id)
 
-                for item_dict in od["items"]:
-                    item_data = item_dict["item"]
-                    category = Category(item_data["category"])
-
-                    menu_item = self.menu.get_item(item_data["name"], category)
-                    if menu_item is None:
-                        menu_item = MenuItem(
-                            name=item_data["name"],
-                            price=item_data["price"],
-                            category=category,
-                            description=item_data["description"],
-                            available=item_data["available"],
-                        )
-                        self.menu.add_item(menu_item)
-
-                    order.add_item(menu_item, item_dict["quantity"])
-
         if max_order_id > 0:
             self._next_order_id = max_order_id + 1
         else:
@@ -210,7 +389,7 @@ class Restaurant:
         lines.append(str(self.menu))
         lines.append("")
 
-        if not self._orders:
+        if not self.order_count():
             lines.append("No orders yet.")
         else:
             lines.append("=== ORDERS ===")
@@ -223,5 +402,5 @@ class Restaurant:
     def __repr__(self) -> str:
         return (
             f"Restaurant(name={self.name!r}, "
-            f"orders={len(self._orders)!r})"
+            f"orders={self.order_count()!r})"
         )
@@ -0,0 +1,118 @@
+import pytest
+
+from models.menu import Menu
+from models.menu_item import MenuItem
+from models.enums import Category
+from models.exceptions import MenuItemNotFoundError, MenuValidationError
+
+
+@pytest.fixture
+def menu():
+    menu = Menu()
+    menu.add_items([
+        MenuItem("Iced Tea", 10.0, Category.Drink),
+        MenuItem("Cheesecake", 22.0, Category.Dessert),
+    ])
+    return menu
+
+
+def test_apply_updates_publishes_one_version(menu):
+    version = menu.version
+    new_version = menu.apply_updates([
+        {"name": "Iced Tea", "category": Category.Drink, "price": 12.0},
+        {"name": "cheesecake ", "category": Category.Dessert, "available": False},
+    ])
+
+    assert new_version == menu.version == version + 1
+    assert menu.get_item("Iced Tea", Category.Drink).price == 12.0
+    assert menu.get_item("Cheesecake", Category.Dessert).available is False
+
+
+def test_invalid_batch_changes_nothing(menu):
+    snapshot = menu.snapshot()
+
+    with pytest.raises(MenuValidationError):
+        menu.apply_updates([
+            {"name": "Iced Tea", "category": Category.Drink, "price": 12.0},
+            {"name": "Cheesecake", "category": Category.Dessert, "price": -1},
+        ])
+    with pytest.raises(MenuItemNotFoundError):
+        menu.apply_updates([
+            {"name": "Iced Tea", "category": Category.Drink, "price": 12.0},
+            {"name": "Soup", "category": Category.Appetizer, "price": 5.0},
+        ])
+
+    assert menu.snapshot() is snapshot
+    assert menu.get_item("Iced Tea", Category.Drink).price == 10.0
+
+
+@pytest.mark.parametrize("update", [
+    {"name": "Iced Tea", "price": 12.0},
+    {"name": "Iced Tea", "category": Category.Drink, "avaliable": False},
+    {"name": "Iced Tea", "category": "Drink", "price": 12.0},
+])
+def test_malformed_updates_are_rejected(menu, update):
+    version = menu.version
+
+    with pytest.raises(MenuValidationError):
+        menu.apply_updates([update])
+    assert menu.version == version
+
+
+def test_unchanged_values_do_not_publish_a_version(menu):
+    version = menu.version
+
+    menu.apply_updates([{"name": "Iced Tea", "category": Category.Drink, "price": 10.0}])
+    menu.apply_updates([])
+
+    assert menu.version == version
+
+
+def test_older_snapshot_is_unchanged_after_update(menu):
+    old = menu.snapshot()
+
+    menu.update_item_price("Iced Tea", Category.Drink, 15.0)
+
+    assert old.get_item("Iced Tea", Category.Drink).price == 10.0
+    assert menu.snapshot().get_item("Iced Tea", Category.Drink).price == 15.0
+
+
+def test_published_items_are_frozen(menu):
+    item = menu.get_item("Iced Tea", Category.Drink)
+
+    with pytest.raises(MenuValidationError):
+        item.update_price(99.0)
+    with pytest.raises(MenuValidationError):
+        item.price = 99.0
+
+    copy = item.copy()
+    copy.update_price(99.0)
+    assert item.price == 10.0
+
+
+def test_description_changes_go_through_the_menu(menu):
+    old = menu.snapshot()
+
+    menu.update_item_description("Iced Tea", Category.Drink, "  With lemon. ")
+
+    assert menu.get_item("Iced Tea", Category.Drink).description == "With lemon."
+    assert old.get_item("Iced Tea", Category.Drink).description == ""
+    with pytest.raises(MenuValidationError):
+        menu.apply_updates([{"name": "Iced Tea", "category": Category.Drink, "description": 5}])
+
+
+@pytest.mark.parametrize("price", ["5", True, None])
+def test_non_numeric_prices_are_rejected(menu, price):
+    version = menu.version
+
+    with pytest.raises(MenuValidationError):
+        menu.apply_updates([{"name": "Iced Tea", "category": Category.Drink, "price": price}])
+    assert menu.version == version
+
+
+def test_empty_add_items_does_not_publish_a_version(menu):
+    version = menu.version
+
+    assert menu.add_items([]) == version
+    assert menu.add_items([], version=version) == version
+    assert menu.version == version
@@ -0,0 +1,182 @@
+import pytest
+
+from models.restaurant import Restaurant
+from models.order import Order
+from models.menu_item import MenuItem
+from models.enums import Category, OrderStatus
+from models.exceptions import MenuItemNotFoundError, MenuValidationError
+from utils.json_store import save_json
+
+
+@pytest.fixture
+def files(tmp_path):
+    return {
+        "menu_file": str(tmp_path / "menu.json"),
+        "orders_file": str(tmp_path / "orders.json"),
+        "header_file": str(tmp_path / "orders_header.json"),
+    }
+
+
+@pytest.fixture
+def saved_restaurant(files):
+    restaurant = Restaurant("Test")
+    restaurant.menu.add_item(MenuItem("Iced Tea", 10.0, Category.Drink))
+    restaurant.menu.add_item(MenuItem("Cheesecake", 22.0, Category.Dessert))
+
+    for quantity in (3, 3):
+        order = restaurant.create_order()
+        restaurant.add_item_to_order(order.order_id, "Iced Tea", Category.Drink, quantity)
+        restaurant.set_order_status(order.order_id, OrderStatus.Completed)
+
+    pending = restaurant.create_order()
+    restaurant.add_item_to_order(pending.order_id, "Cheesecake", Category.Dessert, 1)
+
+    restaurant.menu.update_item_price("Iced Tea", Category.Drink, 20.0)
+    restaurant.save_data(**files)
+    return restaurant
+
+
+def load(files, lazy):
+    restaurant = Restaurant("Test")
+    restaurant.load_data(**files, lazy=lazy)
+    return restaurant
+
+
+def test_lazy_and_eager_loads_report_the_same_revenue(saved_restaurant, files):
+    eager = load(files, lazy=False)
+    lazy = load(files, lazy=True)
+
+    assert eager.total_revenue() == saved_restaurant.total_revenue() == 60.0
+    assert lazy.total_revenue() == 60.0
+
+    lazy.get_order(1)
+    assert lazy.total_revenue() == 60.0
+
+    lazy.list_orders()
+    assert lazy.total_revenue() == 60.0
+
+
+def test_lazy_load_counts_without_hydrating(saved_restaurant, files):
+    lazy = load(files, lazy=True)
+
+    assert lazy.order_count() == 3
+    assert lazy.count_orders_by_status(OrderStatus.Completed) == 2
+    assert lazy.count_orders_by_status(OrderStatus.Pending) == 1
+    assert lazy.create_order().order_id == 4
+
+    lazy.set_order_status(3, OrderStatus.Completed)
+    assert lazy.count_orders_by_status(OrderStatus.Completed) == 3
+    assert lazy.total_revenue() == 82.0
+
+
+def test_stale_header_is_corrected_once_orders_are_read(saved_restaurant, files, tmp_path):
+    (tmp_path / "orders.json").unlink()
+    lazy = load(files, lazy=True)
+
+    assert lazy.list_orders() == []
+    assert lazy.order_count() == 0
+    assert lazy.total_revenue() == 0.0
+
+
+def test_header_next_order_id_is_checked_against_orders(saved_restaurant, files):
+    save_json(
+        {"order_count": 0, "next_order_id": 1, "total_revenue": 0.0, "status_counts": {}},
+        files["header_file"],
+    )
+    lazy = load(files, lazy=True)
+
+    assert lazy.get_order(2).total() == 30.0
+    assert lazy.order_count() == 3
+    assert lazy.total_revenue() == 60.0
+    assert lazy.create_order().order_id == 4
+
+
+def test_hydration_does_not_change_the_menu(saved_restaurant, files):
+    save_json([], files["menu_file"])
+    lazy = load(files, lazy=True)
+    version = lazy.menu.version
+
+    lazy.list_orders()
+    lazy.save_data(**files)
+
+    assert lazy.menu.version == version
+    assert lazy.menu.list_items() == []
+    assert load(files, lazy=False).menu.list_items() == []
+
+
+def test_orders_keep_their_prices_and_version_across_save_and_load(files):
+    restaurant = Restaurant("Test")
+    restaurant.menu.add_item(MenuItem("Iced Tea", 10.0, Category.Drink))
+    order = restaurant.create_order()
+    restaurant.add_item_to_order(order.order_id, "Iced Tea", Category.Drink, 2)
+    pinned_version = order.menu_version
+
+    restaurant.menu.update_item_price("Iced Tea", Category.Drink, 20.0)
+    assert order.total() == 20.0
+
+    restaurant.save_data(**files)
+    for lazy in (False, True):
+        loaded = load(files, lazy=lazy)
+        assert loaded.get_order(order.order_id).menu_version == pinned_version
+        assert loaded.get_order(order.order_id).total() == 20.0
+        assert loaded.menu.version == restaurant.menu.version
+
+
+def test_new_items_come_from_the_current_menu():
+    restaurant = Restaurant("Test")
+    restaurant.menu.add_item(MenuItem("Iced Tea", 10.0, Category.Drink))
+    restaurant.menu.add_item(MenuItem("Cheesecake", 22.0, Category.Dessert))
+    order = restaurant.create_order()
+    restaurant.add_item_to_order(order.order_id, "Cheesecake", Category.Dessert)
+
+    restaurant.menu.add_item(MenuItem("Soup", 8.0, Category.Appetizer))
+    restaurant.add_item_to_order(order.order_id, "Soup", Category.Appetizer)
+
+    restaurant.menu.remove_item("Cheesecake", Category.Dessert)
+    restaurant.menu.set_item_availability("Iced Tea", Category.Drink, False)
+    with pytest.raises(MenuItemNotFoundError):
+        restaurant.add_item_to_order(order.order_id, "Cheesecake", Category.Dessert)
+    with pytest.raises(MenuValidationError):
+        restaurant.add_item_to_order(order.order_id, "Iced Tea", Category.Drink)
+
+    restaurant.change_order_item_quantity(order.order_id, "Cheesecake", Category.Dessert, 2)
+    assert order.total() == 52.0
+    restaurant.remove_item_from_order(order.order_id, "Cheesecake", Category.Dessert)
+    assert order.total() == 8.0
+
+
+def test_create_order_on_stale_header_does_not_reuse_ids(saved_restaurant, files):
+    save_json(
+        {"order_count": 0, "next_order_id": 1, "total_revenue": 0.0, "status_counts": {}},
+        files["header_file"],
+    )
+    lazy = load(files, lazy=True)
+
+    assert lazy.create_order().order_id == 4
+    assert lazy.order_count() == 4
+    assert lazy.total_revenue() == 60.0
+    assert lazy.get_order(1).total() == 30.0
+
+
+def test_clashing_order_ids_raise_instead_of_dropping_records(saved_restaurant, files):
+    lazy = load(files, lazy=True)
+    lazy._orders[1] = Order(order_id=1)
+
+    with pytest.raises(MenuValidationError):
+        lazy.get_order(2)
+
+
+def test_save_and_load_keep_the_menu_version(files):
+    empty = Restaurant("Test")
+    empty.save_data(**files)
+    assert load(files, lazy=False).menu.version == empty.menu.version
+
+    restaurant = Restaurant("Test")
+    restaurant.menu.add_item(MenuItem("Iced Tea", 10.0, Category.Drink))
+    restaurant.menu.update_item_price("Iced Tea", Category.Drink, 12.0)
+    restaurant.save_data(**files)
+
+    loaded = load(files, lazy=False)
+    assert loaded.menu.version == restaurant.menu.version
+    loaded.load_data(**files)
+    assert loaded.menu.version == restaurant.menu.version